@@ -80,6 +80,9 @@ def initialize_rag_system():
             st.write("🤖 Initializing RAG Pipeline (Llama 3)...")
             pipeline = RagPipeline(vector_store)
             
+            # Warm the caches in the background for the suggested questions
+            pipeline.prefetch(pipeline.faq_questions)
+            
             status.update(label="System Ready!", state="complete", expanded=False)
             
         except Exception as e:
@@ -96,6 +99,10 @@ def initialize_rag_system():
     status_container.empty()
     return pipeline
 
+def queue_prompt(question: str):
+    """Button callback: sends a suggested question as the next chat message."""
+    st.session_state.queued_prompt = question
+
 def main():
     st.set_page_config(page_title="Policy Assistant", page_icon="", layout="wide")
     
@@ -199,8 +206,13 @@ def main():
         with st.chat_message(message["role"]):
             st.markdown(message["content"])
 
-    # React to user input
-    if prompt := st.chat_input("Send a message..."):
+    # React to user input, or to a clicked suggestion
+    queued_prompt = st.session_state.pop("queued_prompt", None)
+    prompt = st.chat_input("Send a message...") or queued_prompt
+    if prompt:
+        # Drop the previous answer's follow-ups; refreshed below once this one succeeds
+        st.session_state.follow_ups = []
+
         # Display user message
         st.chat_message("user").markdown(prompt)
         # Add to history
@@ -229,6 +241,8 @@ def main():
                 # Optional details
                 with st.expander("🔍 View Source Details"):
                     docs = pipeline.retrieve(prompt)
+                    # Section headings already prefetched by run(), offered as follow-ups
+                    st.session_state.follow_ups = pipeline.follow_up_queries(docs)
                     if docs:
                         for i, content in enumerate(docs):
                             st.markdown(f"**Source {i+1}:**")
@@ -242,5 +256,22 @@ def main():
             except Exception as e:
                 message_placeholder.error(f"An error occurred: {e}")
 
+    # Suggested follow-ups for the latest answer
+    if st.session_state.get("follow_ups"):
+        st.caption("Related policy sections:")
+        for i, question in enumerate(st.session_state.follow_ups):
+            st.button(question, key=f"follow_up_{i}", on_click=queue_prompt, args=(question,))
+
+    # Rendered after the chat so the metrics include the latest query
+    with st.sidebar:
+        st.subheader("Common Questions")
+        for i, question in enumerate(pipeline.faq_questions):
+            st.button(question, key=f"faq_{i}", on_click=queue_prompt, args=(question,))
+
+        # Retrieval latency for cache-warm vs cold queries
+        st.subheader("Latency")
+        for bucket, stats in pipeline.get_latency_metrics().items():
+            st.metric(f"{bucket.capitalize()} queries ({stats['count']})", f"{stats['mean_ms']:.0f} ms")
+
 if __name__ == "__main__":
     main()
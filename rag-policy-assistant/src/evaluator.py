@@ -1,3 +1,4 @@
+from concurrent.futures import wait
 from typing import List, Dict
 import pandas as pd
 
@@ -27,19 +28,22 @@ class Evaluator:
         """Runs the evaluation set through the pipeline."""
         results = []
         print(f"Starting evaluation on {len(self.evaluation_set)} questions...")
+
+        # Start cold so these runs measure uncached latency
+        self.pipeline.clear_cache()
         
         for item in self.evaluation_set:
             q = item["question"]
             print(f"Processing: {q}")
             try:
-                # Direct call to retrieve to check context (returns List[str])
+                # Generation (retrieves with a cold cache)
+                answer = self.pipeline.run(q)
+
+                # Served from the retrieval cache filled by run()
                 docs = self.pipeline.retrieve(q, k=3)
                 context_found = bool(docs)
                 
-                # Generation
-                if context_found:
-                    answer = self.pipeline.run(q)  # This re-retrieves, which is fine
-                else:
+                if not context_found:
                     answer = "No relevant context found (Refusal Triggered)"
                 
                 results.append({
@@ -63,6 +67,8 @@ class Evaluator:
         df = pd.DataFrame(results)
         df.to_csv("evaluation_results.csv", index=False)
         print("\nEvaluation complete. Results saved to 'evaluation_results.csv'.")
+
+        self.measure_prefetch_latency()
         
         # Print table for README usage
         try:
@@ -70,6 +76,19 @@ class Evaluator:
         except:
              print(df[["Question", "Actual Answer"]])
 
+    def measure_prefetch_latency(self):
+        """Prefetches the evaluation questions, re-runs them without the LLM and prints warm vs cold latency."""
+        questions = [item["question"] for item in self.evaluation_set]
+
+        self.pipeline.clear_cache()
+        wait(self.pipeline.prefetch(questions))
+        for q in questions:
+            self.pipeline.build_inputs(q)
+
+        # Pre-LLM latency: cold from the generation pass above, warm from the prefetched pass
+        for bucket, stats in self.pipeline.get_latency_metrics().items():
+            print(f"{bucket.capitalize()} queries: {stats['count']}, mean latency {stats['mean_ms']:.1f} ms")
+
 if __name__ == "__main__":
     # Setup dependencies
     # Vector store setup (auto-loads if needed via app logic, but here we assume it exists or init empty)
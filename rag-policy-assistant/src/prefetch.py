@@ -0,0 +1,83 @@
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional
+
+# Numbered policy section heading, e.g. "2.1 Standard Returns (Change of Mind)"
+SECTION_HEADING = re.compile(r"^\d+(?:\.\d+)*\.?\s+(?P<title>.+)$")
+
+# Words left lowercase inside title-case headings
+MINOR_WORDS = {"a", "an", "and", "as", "at", "by", "for", "in", "of", "on", "or", "the", "to", "with"}
+
+class LRUCache:
+    def __init__(self, max_size: int = 512):
+        """
+        Thread-safe least-recently-used cache.
+
+        Args:
+            max_size (int): Maximum number of entries kept before evicting.
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Returns the cached value (marking it recently used), or None on a miss."""
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: Hashable, value: Any):
+        """Stores a value, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Removes all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+def _is_title_case(title: str) -> bool:
+    """Checks that every significant word of a heading starts with a capital letter."""
+    words = title.split()
+    if not 1 <= len(words) <= 8 or title.endswith((".", ",", ";", ":")):
+        return False
+    for i, word in enumerate(words):
+        word = word.strip("()\"'")
+        if not word or (i > 0 and word.lower() in MINOR_WORDS):
+            continue
+        if not word[0].isupper():
+            return False
+    return True
+
+def extract_section_headings(text: str, limit: int = 3) -> List[str]:
+    """
+    Extracts numbered, title-case section headings from policy text.
+
+    Args:
+        text (str): Policy text, with the line breaks produced by the PDF loader.
+        limit (int): Maximum number of headings to return.
+
+    Returns:
+        List[str]: Heading titles without their section numbers.
+    """
+    headings = []
+    for line in text.splitlines():
+        match = SECTION_HEADING.match(line.strip())
+        if not match:
+            continue
+        title = match.group("title").strip()
+        if _is_title_case(title) and title not in headings:
+            headings.append(title)
+            if len(headings) >= limit:
+                break
+    return headings
@@ -1,5 +1,8 @@
 import os
-from typing import List, Dict, Any, Optional
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 
 from langchain_groq import ChatGroq
 from langchain_core.prompts import ChatPromptTemplate
@@ -8,6 +11,7 @@ from langchain_core.documents import Document
 
 from src.vector_store import VectorStore
 from src.model import get_groq_model
+from src.prefetch import LRUCache, extract_section_headings
 
 # Prompt definitions
 PROMPT_V1 = ChatPromptTemplate.from_template(
@@ -43,6 +47,17 @@ PROMPT_V2 = ChatPromptTemplate.from_template(
 """
 )
 
+# Frequently asked questions, warmed into the retrieval cache at startup
+FAQ_QUESTIONS = [
+    "What is the time limit for requesting a refund after delivery?",
+    "How can a customer cancel an order before it is shipped?",
+    "Can a customer return a discounted item purchased during a sale?",
+    "What happens if a package is delayed due to courier issues?",
+    "Does the company offer refunds for digital products like software subscriptions?",
+    "What is the customer support phone number for urgent issues?",
+    "Do employees receive special internal discounts?",
+]
+
 def get_prompt(version: str = "v2") -> ChatPromptTemplate:
     if version == "v1":
         return PROMPT_V1
@@ -52,23 +67,85 @@ def get_prompt(version: str = "v2") -> ChatPromptTemplate:
         raise ValueError(f"Unknown prompt version: {version}")
 
 class RagPipeline:
-    def __init__(self, vector_store: VectorStore, llm_model: str = "llama-3.3-70b-versatile"):
+    def __init__(self, vector_store: VectorStore, llm_model: str = "llama-3.3-70b-versatile", prefetch_workers: int = 2):
         """
         Initializes the RAG Pipeline.
         
         Args:
             vector_store (VectorStore): The initialized custom VectorStore instance.
             llm_model (str): The name of the Groq model to use.
+            prefetch_workers (int): Background threads used to warm the retrieval cache.
         """
         self.vector_store = vector_store
         # Use centralized model initialization
         self.llm = get_groq_model(model_name=llm_model)
         
         self.prompt = get_prompt("v2") # Default to strict prompt
+        self.faq_questions = list(FAQ_QUESTIONS)
+        # Build the chain once instead of on every query
+        self.chain = self.prompt | self.llm | StrOutputParser()
+
+        # (normalized query, k) -> retrieved contents, filled by queries and prefetch
+        self._retrieval_cache = LRUCache()
+        # Same keys, for prefetches that are still running
+        self._pending: Dict[Tuple[str, int], Future] = {}
+        # Bumped by clear_cache() so searches started before it can't refill the cache
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=prefetch_workers, thread_name_prefix="rag-prefetch")
+
+        # Seconds spent before the LLM call, split by whether retrieval hit the cache
+        self._latencies: Dict[str, List[float]] = {"warm": [], "cold": []}
+
+    @staticmethod
+    def _normalize(query: str) -> str:
+        """Collapses whitespace so trivially different inputs share a cache entry."""
+        return " ".join(query.split())
+
+    def _search_and_cache(self, key: Tuple[str, int], generation: int) -> List[str]:
+        """
+        Searches the vector store and stores non-empty results in the retrieval cache,
+        unless clear_cache() was called since the search started.
+        """
+        docs = self._search(*key)
+        # Empty results may come from a failed query, so don't pin them in the cache
+        if docs:
+            with self._lock:
+                if generation == self._generation:
+                    self._retrieval_cache.put(key, list(docs))
+        return docs
+
+    def _prefetch_one(self, key: Tuple[str, int], generation: int) -> List[str]:
+        """Background job: fills the cache, then clears the in-flight marker."""
+        try:
+            return self._search_and_cache(key, generation)
+        finally:
+            with self._lock:
+                # After clear_cache() the marker is gone, and the key may belong to a newer job
+                if generation == self._generation:
+                    self._pending.pop(key, None)
+
+    def _retrieve_cached(self, query: str, k: int) -> Tuple[List[str], bool]:
+        """
+        Returns (docs, cache_hit). Waits on a running prefetch for the same query
+        instead of searching again, and searches the vector store only on a miss.
+        """
+        key = (self._normalize(query), k)
+        with self._lock:
+            cached = self._retrieval_cache.get(key)
+            pending = self._pending.get(key)
+            generation = self._generation
+        if cached is not None:
+            return list(cached), True
+        if pending is not None:
+            return list(pending.result()), True
+
+        return self._search_and_cache(key, generation), False
 
     def retrieve(self, query: str, k: int = 3) -> List[str]:
         """
         Retrieves relevant document contents based on the query.
+        Results are served from the retrieval cache when available.
         
         Args:
             query (str): User query.
@@ -77,6 +154,11 @@ class RagPipeline:
         Returns:
             List[str]: Content of relevant documents.
         """
+        docs, _ = self._retrieve_cached(query, k)
+        return docs
+
+    def _search(self, query: str, k: int) -> List[str]:
+        """Queries the vector store and unpacks the document contents."""
         # Query the vector store
         results = self.vector_store.query(query, k=k)
         
@@ -98,31 +180,121 @@ class RagPipeline:
                 
         return relevant_docs
 
-    def run(self, query: str) -> str:
+    def prefetch(self, questions: List[str], k: int = 3) -> List[Future]:
         """
-        Runs the RAG pipeline end-to-end.
+        Warms the embedding and retrieval caches for likely next questions
+        in the background. No LLM calls are made.
+        
+        Args:
+            questions (List[str]): Candidate questions to retrieve ahead of time.
+            k (int): Number of documents to retrieve per question.
+            
+        Returns:
+            List[Future]: One future per question that is not cached yet, including ones already in flight.
+        """
+        futures = []
+        for question in dict.fromkeys(self._normalize(q) for q in questions):
+            if not question:
+                continue
+            key = (question, k)
+            with self._lock:
+                if key in self._retrieval_cache:
+                    continue
+                future = self._pending.get(key)
+                if future is None:
+                    # The job unregisters itself under this lock, so it can't finish before this line
+                    future = self._executor.submit(self._prefetch_one, key, self._generation)
+                    self._pending[key] = future
+            futures.append(future)
+        return futures
+
+    def clear_cache(self):
+        """
+        Drops cached retrieval results and query embeddings. Prefetches still
+        running are detached rather than waited on: their results are discarded
+        and later queries for the same key search again.
+        """
+        with self._lock:
+            self._generation += 1
+            self._pending.clear()
+            self._retrieval_cache.clear()
+        self.vector_store.clear_cache()
+
+    @staticmethod
+    def follow_up_queries(docs: List[str], limit: int = 3) -> List[str]:
+        """
+        Extracts policy section headings from retrieved text to use as likely follow-up queries.
+        
+        Args:
+            docs (List[str]): Retrieved document contents.
+            limit (int): Maximum number of queries to return.
+            
+        Returns:
+            List[str]: Candidate follow-up queries.
+        """
+        return extract_section_headings("\n".join(docs), limit=limit)
+
+    def get_latency_metrics(self) -> Dict[str, Dict[str, float]]:
+        """
+        Summarizes time spent before the LLM call for cache-warm and cold queries.
+        
+        Returns:
+            Dict[str, Dict[str, float]]: Per bucket, the query count and mean latency in milliseconds.
+        """
+        with self._lock:
+            latencies = {bucket: list(values) for bucket, values in self._latencies.items()}
+        return {
+            bucket: {
+                "count": len(values),
+                "mean_ms": (sum(values) / len(values) * 1000) if values else 0.0,
+            }
+            for bucket, values in latencies.items()
+        }
+
+    def build_inputs(self, query: str) -> Optional[Dict[str, str]]:
+        """
+        Retrieves context and builds the prompt inputs, recording the latency
+        as cache-warm or cold. Follow-up questions are prefetched in the background.
         
         Args:
             query (str): User query.
             
         Returns:
-            str: Generated answer.
+            Optional[Dict[str, str]]: Prompt inputs, or None if no context was found.
         """
-        docs = self.retrieve(query)
+        start = time.perf_counter()
+        docs, cache_hit = self._retrieve_cached(query, 3)
         
         if not docs:
-            return "I'm sorry, but I couldn't find any information in the policy documents related to your query."
+            return None
         
         context_str = "\n\n".join(docs)
+        inputs = {"context": context_str, "question": query}
+
+        with self._lock:
+            self._latencies["warm" if cache_hit else "cold"].append(time.perf_counter() - start)
+
+        # Retrieve likely follow-ups while the LLM is generating
+        self.prefetch(self.follow_up_queries(docs))
+        return inputs
+
+    def run(self, query: str) -> str:
+        """
+        Runs the RAG pipeline end-to-end.
         
-        chain = (
-            self.prompt
-            | self.llm
-            | StrOutputParser()
-        )
+        Args:
+            query (str): User query.
+            
+        Returns:
+            str: Generated answer.
+        """
+        inputs = self.build_inputs(query)
+        
+        if inputs is None:
+            return "I'm sorry, but I couldn't find any information in the policy documents related to your query."
         
         # Invoke chain
-        return chain.invoke({"context": context_str, "question": query})
+        return self.chain.invoke(inputs)
 
 if __name__ == "__main__":
     pass
@@ -1,6 +1,9 @@
 import chromadb
 import os
 from typing import List, Dict, Any
+from chromadb.utils import embedding_functions
+
+from src.prefetch import LRUCache
 
 # Force CPU mode for Chroma embeddings to silence PyTorch logs/warnings
 os.environ["CUDA_VISIBLE_DEVICES"] = ""
@@ -12,7 +15,15 @@ class VectorStore:
         This avoids permission errors on Streamlit Cloud.
         """
         self.client = chromadb.Client()  # in-memory (Ephemeral)
-        self.collection = self.client.get_or_create_collection(name=collection_name)
+        # Same default model Chroma would pick, held here so query embeddings can be cached
+        self.embedding_function = embedding_functions.DefaultEmbeddingFunction()
+        self.collection = self.client.get_or_create_collection(
+            name=collection_name,
+            embedding_function=self.embedding_function
+        )
+
+        # Query text -> embedding, shared with background prefetch threads
+        self._embedding_cache = LRUCache()
 
     def add_documents(self, documents):
         """Adds documents to the vector store."""
@@ -32,6 +43,20 @@ class VectorStore:
         except Exception as e:
             print(f"Error adding documents: {e}")
 
+    def embed_query(self, query: str) -> Any:
+        """Returns the embedding for a query, computing it only on a cache miss."""
+        cached = self._embedding_cache.get(query)
+        if cached is not None:
+            return cached
+
+        embedding = self.embedding_function([query])[0]
+        self._embedding_cache.put(query, embedding)
+        return embedding
+
+    def clear_cache(self):
+        """Drops all cached query embeddings."""
+        self._embedding_cache.clear()
+
     def query(self, query: str, k: int = 3) -> Dict[str, Any]:
         """
         Queries the vector store for similar documents.
@@ -39,7 +64,7 @@ class VectorStore:
         """
         try:
             return self.collection.query(
-                query_texts=[query],
+                query_embeddings=[self.embed_query(query)],
                 n_results=k
             )
         except Exception as e:
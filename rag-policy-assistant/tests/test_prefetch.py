@@ -0,0 +1,48 @@
+from src.prefetch import LRUCache, extract_section_headings
+
+# Verbatim PyPDF output from data/cancellation_policy.pdf (page 1)
+CANCELLATION_TEXT = (
+    "CANCELLATION POLICY \n"
+    "This policy defines the standards and procedures for order cancellations. It \n"
+    "serves as the primary reference for customer support staff to ensure \n"
+    " \n"
+    "1. Policy Overview \n"
+    "Customers may request to cancel an order at any time before it has been \n"
+    "2. Cancellation Windows by Order Status \n"
+    "• Processing: This status indicates the warehouse has received the order \n"
+    "and is beginning to pick and pack. Cancellation requests at this stage \n"
+    "3.1 Customer-Initiated Cancellations \n"
+)
+
+# Verbatim PyPDF output from data/shipping_policy.pdf (pages 1-2)
+SHIPPING_TEXT = (
+    "Method Estimated Delivery Cost Basis \n"
+    "Standard 5–7 Business Days Flat rate or free over $75 \n"
+    "Next-Day 1 Business Day Fixed premium rate \n"
+    "5.2 Missing Packages (Marked Delivered) \n"
+    "If a package is marked as delivered but the customer claims they have not \n"
+    "24 hours. \n"
+)
+
+def test_extract_section_headings_from_cancellation_policy():
+    assert extract_section_headings(CANCELLATION_TEXT, limit=5) == [
+        "Policy Overview",
+        "Cancellation Windows by Order Status",
+        "Customer-Initiated Cancellations",
+    ]
+
+def test_extract_section_headings_skips_body_and_table_lines():
+    assert extract_section_headings(SHIPPING_TEXT) == ["Missing Packages (Marked Delivered)"]
+
+def test_extract_section_headings_respects_limit():
+    assert extract_section_headings(CANCELLATION_TEXT, limit=1) == ["Policy Overview"]
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.get("c") == 3
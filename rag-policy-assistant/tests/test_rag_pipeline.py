@@ -0,0 +1,125 @@
+import threading
+from concurrent.futures import wait
+
+import pytest
+from langchain_core.runnables import RunnableLambda
+
+import src.rag_pipeline
+from src.rag_pipeline import RagPipeline
+
+# Retrieved chunk with one numbered heading, so follow-ups get prefetched too
+CHUNK = "4. Refund Methods \nRefunds are issued based on the original transaction type: \n"
+
+class StubVectorStore:
+    """Counts queries and can hold them until released, like a slow embedding + search."""
+
+    def __init__(self, documents=None):
+        self.documents = [CHUNK] if documents is None else documents
+        self.calls = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def query(self, query, k=3):
+        self.calls.append(query)
+        self.started.set()
+        self.release.wait(timeout=5)
+        # VectorStore.query returns {} when Chroma raises
+        return {"documents": [self.documents]} if self.documents else {}
+
+    def clear_cache(self):
+        pass
+
+@pytest.fixture
+def llm_calls(monkeypatch):
+    calls = []
+
+    def fake_model(model_name=None):
+        def answer(prompt_value):
+            calls.append(prompt_value)
+            return "answer"
+        return RunnableLambda(answer)
+
+    monkeypatch.setattr(src.rag_pipeline, "get_groq_model", fake_model)
+    return calls
+
+def test_prefetch_shares_future_for_same_question(llm_calls):
+    store = StubVectorStore()
+    store.release.clear()
+    pipeline = RagPipeline(store)
+
+    first = pipeline.prefetch(["What is the refund window?"])
+    second = pipeline.prefetch(["  What is the refund   window? "])
+    assert len(first) == 1 and first[0] is second[0]
+
+    store.release.set()
+    wait(first)
+    assert pipeline._pending == {}
+    assert store.calls == ["What is the refund window?"]
+
+def test_build_inputs_waits_on_running_prefetch_and_counts_warm(llm_calls):
+    store = StubVectorStore(documents=["Refunds are issued within 30 days."])
+    store.release.clear()
+    pipeline = RagPipeline(store)
+
+    futures = pipeline.prefetch(["What is the refund window?"])
+    assert store.started.wait(timeout=5)
+
+    results = []
+    worker = threading.Thread(target=lambda: results.append(pipeline.build_inputs("What is the refund window?")))
+    worker.start()
+    worker.join(timeout=0.2)
+    # Still blocked on the prefetch future rather than searching on its own
+    assert worker.is_alive()
+
+    store.release.set()
+    worker.join(timeout=5)
+    wait(futures)
+
+    assert results[0]["context"] == "Refunds are issued within 30 days."
+    assert len(store.calls) == 1
+    metrics = pipeline.get_latency_metrics()
+    assert metrics["warm"]["count"] == 1
+    assert metrics["cold"]["count"] == 0
+
+def test_cache_miss_is_cold_and_empty_results_are_not_cached(llm_calls):
+    store = StubVectorStore(documents=[])
+    pipeline = RagPipeline(store)
+
+    assert pipeline.build_inputs("Can I pay with Bitcoin?") is None
+    assert pipeline.build_inputs("Can I pay with Bitcoin?") is None
+    assert len(store.calls) == 2
+
+    store.documents = ["Payment is accepted by card."]
+    assert pipeline.build_inputs("Can I pay with Bitcoin?") is not None
+    metrics = pipeline.get_latency_metrics()
+    assert metrics["cold"]["count"] == 1
+    assert metrics["warm"]["count"] == 0
+
+def test_prefetch_never_calls_llm(llm_calls):
+    pipeline = RagPipeline(StubVectorStore())
+
+    wait(pipeline.prefetch(pipeline.faq_questions))
+    inputs = pipeline.build_inputs("How are refunds paid?")
+    # build_inputs prefetched the "Refund Methods" follow-up in the background
+    wait(pipeline.prefetch(pipeline.follow_up_queries([inputs["context"]])))
+    assert llm_calls == []
+
+    assert pipeline.run("How are refunds paid?") == "answer"
+    assert len(llm_calls) == 1
+
+def test_clear_cache_discards_running_prefetch(llm_calls):
+    store = StubVectorStore()
+    store.release.clear()
+    pipeline = RagPipeline(store)
+
+    futures = pipeline.prefetch(["What is the refund window?"])
+    assert store.started.wait(timeout=5)
+    pipeline.clear_cache()
+    store.release.set()
+    wait(futures)
+
+    assert pipeline._pending == {}
+    assert ("What is the refund window?", 3) not in pipeline._retrieval_cache
+    pipeline.build_inputs("What is the refund window?")
+    assert pipeline.get_latency_metrics()["cold"]["count"] == 1